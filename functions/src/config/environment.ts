@@ -2,13 +2,46 @@
  * Environment configuration for Firebase Functions
  * Uses environment variables for configuration (modern approach)
  */
+// Static limits are built once at module load and frozen so every caller
+// shares the same object instead of allocating a new one per request
+const RATE_LIMIT_CONFIG = Object.freeze({
+  maxRequestsPerHour: 50, // Per user rate limit
+  maxRequestsPerMinute: 5, // Burst protection
+});
+
+const RETRY_CONFIG = Object.freeze({
+  maxRetries: 3,
+  initialDelayMs: 1000,
+  maxDelayMs: 10000,
+  backoffMultiplier: 2,
+});
+
+const SUMMARY_CACHE_CONFIG = Object.freeze({
+  collection: 'summaryCache',
+  ttlMs: 7 * 24 * 60 * 60 * 1000, // 7 days
+});
+
+const QUOTA_LIMITS = Object.freeze({
+  dailyRequestsPerUser: 100,
+  monthlyRequestsPerUser: 1000,
+});
+
 export class Environment {
+  // process.env is fixed for the lifetime of an instance, so look the key
+  // up once instead of on every OpenRouterService construction
+  private static openRouterApiKey?: string;
+
   /**
    * Get OpenRouter API key from environment
    */
   static getOpenRouterApiKey(): string {
+    if (Environment.openRouterApiKey) {
+      return Environment.openRouterApiKey;
+    }
+
     const envKey = process.env.OPENROUTER_API_KEY;
     if (envKey) {
+      Environment.openRouterApiKey = envKey;
       return envKey;
     }
 
@@ -54,34 +87,42 @@ export class Environment {
   }
 
   /**
-   * Get rate limit configuration
+   * Get runtime configuration for the summarization function
    */
-  static getRateLimitConfig() {
+  static getRuntimeConfig() {
     return {
-      maxRequestsPerHour: 50, // Per user rate limit
-      maxRequestsPerMinute: 5, // Burst protection
+      // Requests spend almost all their time waiting on OpenRouter, so one
+      // instance can multiplex many of them instead of scaling out per call
+      concurrency: 80,
+      cpu: 1,
     };
   }
 
+  /**
+   * Get rate limit configuration
+   */
+  static getRateLimitConfig() {
+    return RATE_LIMIT_CONFIG;
+  }
+
   /**
    * Get retry configuration
    */
   static getRetryConfig() {
-    return {
-      maxRetries: 3,
-      initialDelayMs: 1000,
-      maxDelayMs: 10000,
-      backoffMultiplier: 2,
-    };
+    return RETRY_CONFIG;
+  }
+
+  /**
+   * Get summary cache configuration
+   */
+  static getSummaryCacheConfig() {
+    return SUMMARY_CACHE_CONFIG;
   }
 
   /**
    * Get quota limits
    */
   static getQuotaLimits() {
-    return {
-      dailyRequestsPerUser: 100,
-      monthlyRequestsPerUser: 1000,
-    };
+    return QUOTA_LIMITS;
   }
 }
\ No newline at end of file
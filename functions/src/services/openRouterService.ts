@@ -1,7 +1,15 @@
 import axios, { AxiosResponse, AxiosError } from 'axios';
+import * as https from 'https';
+import { Readable } from 'stream';
 import { HttpsError } from 'firebase-functions/v2/https';
 import { logger } from 'firebase-functions/v2';
 import { Environment } from '../config/environment';
+import {
+  OpenRouterErrorResponse,
+  createErrorFromResponse,
+  readCompletionStream,
+  readErrorBody
+} from './openRouterStream';
 
 interface OpenRouterMessage {
   role: 'system' | 'user' | 'assistant';
@@ -13,31 +21,35 @@ interface OpenRouterRequest {
   messages: OpenRouterMessage[];
   max_tokens: number;
   temperature?: number;
+  stream?: boolean;
 }
 
-interface OpenRouterResponse {
-  choices: Array<{
-    message: {
-      content: string;
-    };
-  }>;
-  usage?: {
-    prompt_tokens: number;
-    completion_tokens: number;
-    total_tokens: number;
-  };
-}
+// Shared across invocations on a warm instance so repeated summaries reuse
+// the TCP/TLS connection to OpenRouter instead of handshaking every call.
+// Each in-flight request holds one socket, so allow as many as the instance
+// may run concurrently rather than queueing callers behind the agent.
+const httpClient = axios.create({
+  httpsAgent: new https.Agent({
+    keepAlive: true,
+    maxSockets: Environment.getRuntimeConfig().concurrency,
+  }),
+});
 
-interface OpenRouterErrorResponse {
-  error: {
-    message: string;
-    type: string;
-    code?: string;
-  };
-}
+// The prompt and static headers never change between calls, so build them
+// once at module load; each request only supplies the note content
+const SYSTEM_MESSAGE: OpenRouterMessage = {
+  role: 'system',
+  content: 'You are a helpful assistant that creates concise, informative summaries of text content. Focus on the main points, key ideas, and important details. Keep summaries clear and well-structured. Limit your response to 2-3 sentences for short content, or 1-2 paragraphs for longer content.'
+};
+
+const BASE_HEADERS = {
+  'Content-Type': 'application/json',
+  'HTTP-Referer': 'https://smart-notes-app.com',
+  'X-Title': 'Smart Notes AI Summarization'
+};
 
 export class OpenRouterService {
-  private readonly apiKey: string;
+  private readonly headers: Record<string, string>;
   private readonly baseUrl = 'https://openrouter.ai/api/v1/chat/completions';
   private readonly primaryModel = 'openai/gpt-4o-mini';
   private readonly fallbackModel = 'google/gemma-2-9b-it:free';
@@ -46,7 +58,10 @@ export class OpenRouterService {
 
   constructor() {
     // Get API key from environment configuration (Requirements 3.1, 3.3)
-    this.apiKey = Environment.getOpenRouterApiKey();
+    this.headers = {
+      ...BASE_HEADERS,
+      'Authorization': `Bearer ${Environment.getOpenRouterApiKey()}`
+    };
     this.timeout = Environment.getRequestTimeout();
     this.retryConfig = Environment.getRetryConfig();
   }
@@ -138,43 +153,39 @@ export class OpenRouterService {
     const request: OpenRouterRequest = {
       model: model,
       messages: [
-        {
-          role: 'system',
-          content: 'You are a helpful assistant that creates concise, informative summaries of text content. Focus on the main points, key ideas, and important details. Keep summaries clear and well-structured. Limit your response to 2-3 sentences for short content, or 1-2 paragraphs for longer content.'
-        },
+        SYSTEM_MESSAGE,
         {
           role: 'user',
           content: `Please summarize the following note content:\n\n${content}`
         }
       ],
       max_tokens: 150,
-      temperature: 0.3
+      temperature: 0.3,
+      stream: true
     };
 
     try {
-      const response: AxiosResponse<OpenRouterResponse> = await axios.post(
+      const response: AxiosResponse<Readable> = await httpClient.post(
         this.baseUrl,
         request,
         {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json',
-            'HTTP-Referer': 'https://smart-notes-app.com',
-            'X-Title': 'Smart Notes AI Summarization'
-          },
+          headers: this.headers,
           timeout: this.timeout,
+          responseType: 'stream',
           validateStatus: (status) => status < 500 // Don't throw on 4xx errors, handle them explicitly
         }
       );
 
       // Handle non-2xx responses
       if (response.status >= 400) {
-        const errorData = response.data as unknown as OpenRouterErrorResponse;
-        throw this.createErrorFromResponse(response.status, errorData);
+        const errorData = await readErrorBody(response.data);
+        throw createErrorFromResponse(response.status, errorData);
       }
 
-      // Extract summary from response
-      const summary = response.data.choices[0]?.message?.content?.trim();
+      // Extract summary from the streamed response. The axios timeout stops
+      // applying once headers arrive, so the body gets its own deadline.
+      const completion = await readCompletionStream(response.data, this.timeout);
+      const summary = completion.summary.trim();
       
       if (!summary) {
         throw new Error('Empty response from AI service');
@@ -190,12 +201,12 @@ export class OpenRouterService {
       }
 
       // Log usage statistics for monitoring
-      if (response.data.usage) {
+      if (completion.usage) {
         logger.info('OpenRouter API usage', {
           model,
-          tokens: response.data.usage.total_tokens,
-          promptTokens: response.data.usage.prompt_tokens,
-          completionTokens: response.data.usage.completion_tokens
+          tokens: completion.usage.total_tokens,
+          promptTokens: completion.usage.prompt_tokens,
+          completionTokens: completion.usage.completion_tokens
         });
       }
 
@@ -216,10 +227,14 @@ export class OpenRouterService {
           throw new Error('NETWORK_ERROR');
         }
         
-        // Handle HTTP errors with response
+        // Handle HTTP errors with response. With responseType 'stream' the
+        // body is a Readable; reading it also releases the socket.
         if (axiosError.response) {
-          const errorData = axiosError.response.data as OpenRouterErrorResponse;
-          throw this.createErrorFromResponse(axiosError.response.status, errorData);
+          const body = axiosError.response.data;
+          const errorData = body instanceof Readable
+            ? await readErrorBody(body)
+            : body as OpenRouterErrorResponse;
+          throw createErrorFromResponse(axiosError.response.status, errorData);
         }
         
         // Handle request errors without response
@@ -231,31 +246,6 @@ export class OpenRouterService {
     }
   }
 
-  /**
-   * Create appropriate error from OpenRouter API response
-   */
-  private createErrorFromResponse(status: number, errorData?: OpenRouterErrorResponse): Error {
-    const errorMessage = errorData?.error?.message || 'Unknown API error';
-    
-    switch (status) {
-      case 400:
-        return new Error(`INVALID_REQUEST: ${errorMessage}`);
-      case 401:
-        return new Error(`INVALID_API_KEY: ${errorMessage}`);
-      case 403:
-        return new Error(`FORBIDDEN: ${errorMessage}`);
-      case 429:
-        return new Error(`RATE_LIMITED: ${errorMessage}`);
-      case 500:
-      case 502:
-      case 503:
-      case 504:
-        return new Error(`SERVICE_UNAVAILABLE: ${errorMessage}`);
-      default:
-        return new Error(`API_ERROR: ${errorMessage}`);
-    }
-  }
-
   /**
    * Determine if an error should trigger a retry
    */
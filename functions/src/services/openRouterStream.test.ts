@@ -0,0 +1,154 @@
+import * as assert from 'assert';
+import { describe, it } from 'node:test';
+import { PassThrough } from 'stream';
+import { readCompletionStream, readErrorBody } from './openRouterStream';
+
+const usage = { prompt_tokens: 12, completion_tokens: 5, total_tokens: 17 };
+const timeoutMs = 1000;
+
+function delta(content: string, finishReason: string | null = null): string {
+  return `data: ${JSON.stringify({ choices: [{ delta: { content }, finish_reason: finishReason }] })}\n\n`;
+}
+
+function usageEvent(): string {
+  return `data: ${JSON.stringify({ choices: [], usage })}\n\n`;
+}
+
+function streamOf(chunks: string[]): PassThrough {
+  const stream = new PassThrough();
+  for (const chunk of chunks) {
+    stream.write(chunk);
+  }
+  stream.end();
+  return stream;
+}
+
+describe('readCompletionStream', () => {
+  it('joins content deltas split across chunks', async () => {
+    const events = delta('Hello') + delta(' world', 'stop') + usageEvent() + 'data: [DONE]\n\n';
+    const chunks = [events.slice(0, 7), events.slice(7, 40), events.slice(40)];
+
+    const completion = await readCompletionStream(streamOf(chunks), timeoutMs);
+
+    assert.strictEqual(completion.summary, 'Hello world');
+    assert.deepStrictEqual(completion.usage, usage);
+  });
+
+  it('ignores keep-alive comments and blank lines', async () => {
+    const stream = streamOf([
+      ': OPENROUTER PROCESSING\n\n',
+      delta('Short'),
+      ': OPENROUTER PROCESSING\n',
+      '\n',
+      delta(' note', 'stop'),
+      'data: [DONE]\n\n'
+    ]);
+
+    const completion = await readCompletionStream(stream, timeoutMs);
+
+    assert.strictEqual(completion.summary, 'Short note');
+    assert.strictEqual(completion.usage, undefined);
+  });
+
+  it('handles a final event without a trailing newline', async () => {
+    const completion = await readCompletionStream(streamOf([
+      delta('Tail', 'stop'),
+      `data: ${JSON.stringify({ choices: [], usage })}`
+    ]), timeoutMs);
+
+    assert.strictEqual(completion.summary, 'Tail');
+    assert.deepStrictEqual(completion.usage, usage);
+  });
+
+  it('resolves once usage follows the finish reason and drains the rest', async () => {
+    const stream = new PassThrough();
+    let ended = false;
+    stream.on('end', () => {
+      ended = true;
+    });
+
+    stream.write(delta('Done early', 'stop'));
+    stream.write(usageEvent());
+
+    const completion = await readCompletionStream(stream, timeoutMs);
+    assert.strictEqual(completion.summary, 'Done early');
+    assert.strictEqual(stream.destroyed, false);
+
+    // The trailing events are still consumed so the socket can be reused
+    stream.end('data: [DONE]\n\n');
+    await new Promise((resolve) => setImmediate(resolve));
+    assert.strictEqual(ended, true);
+  });
+
+  it('maps in-stream error codes to the matching error type', async () => {
+    const rateLimited = streamOf([
+      delta('Partial'),
+      `data: ${JSON.stringify({ error: { message: 'Slow down', code: 429 } })}\n\n`
+    ]);
+    await assert.rejects(readCompletionStream(rateLimited, timeoutMs), /^Error: RATE_LIMITED: Slow down$/);
+
+    const invalid = streamOf([
+      `data: ${JSON.stringify({ error: { message: 'Bad input', code: '400' } })}\n\n`
+    ]);
+    await assert.rejects(readCompletionStream(invalid, timeoutMs), /^Error: INVALID_REQUEST: Bad input$/);
+  });
+
+  it('treats error events without a status code as upstream failures', async () => {
+    const stream = streamOf([
+      `data: ${JSON.stringify({ error: { message: 'Provider crashed', code: 'server_error' } })}\n\n`
+    ]);
+
+    await assert.rejects(readCompletionStream(stream, timeoutMs), /^Error: SERVICE_UNAVAILABLE: Provider crashed$/);
+  });
+
+  it('reports socket failures as network errors', async () => {
+    const stream = new PassThrough();
+    stream.write(delta('Cut'));
+    setImmediate(() => stream.destroy(new Error('read ECONNRESET')));
+
+    await assert.rejects(readCompletionStream(stream, timeoutMs), /^Error: NETWORK_ERROR: read ECONNRESET$/);
+  });
+
+  it('rejects a malformed event as an upstream failure', async () => {
+    const stream = streamOf([delta('Cut'), 'data: {"choices":[{"delta":\n\n']);
+
+    await assert.rejects(readCompletionStream(stream, timeoutMs), /^Error: SERVICE_UNAVAILABLE: malformed stream event$/);
+  });
+
+  it('times out a stream that stalls after the headers', async () => {
+    const stream = new PassThrough();
+    stream.write(delta('Stalled'));
+    // Keep-alive comments alone must not extend the deadline
+    const keepAlive = setInterval(() => stream.write(': OPENROUTER PROCESSING\n\n'), 10);
+
+    try {
+      await assert.rejects(readCompletionStream(stream, 50), /^Error: REQUEST_TIMEOUT: no completion within 50ms$/);
+      assert.strictEqual(stream.destroyed, true);
+    } finally {
+      clearInterval(keepAlive);
+    }
+  });
+
+  it('reports a connection closed before the end as a network error', async () => {
+    const stream = new PassThrough();
+    stream.write(delta('Cut'));
+    setImmediate(() => stream.destroy());
+
+    await assert.rejects(readCompletionStream(stream, timeoutMs), /^Error: NETWORK_ERROR: stream closed before completion$/);
+  });
+});
+
+describe('readErrorBody', () => {
+  it('parses a JSON error body', async () => {
+    const body = await readErrorBody(streamOf([
+      '{"error":{"message":"Inva',
+      'lid key","code":401}}'
+    ]));
+
+    assert.strictEqual(body?.error.message, 'Invalid key');
+  });
+
+  it('returns undefined for a non-JSON body', async () => {
+    assert.strictEqual(await readErrorBody(streamOf(['<html>Bad Gateway</html>'])), undefined);
+  });
+});
@@ -0,0 +1,206 @@
+import { Readable } from 'stream';
+
+export interface OpenRouterUsage {
+  prompt_tokens: number;
+  completion_tokens: number;
+  total_tokens: number;
+}
+
+export interface OpenRouterErrorResponse {
+  error: {
+    message: string;
+    type?: string;
+    code?: string | number;
+  };
+}
+
+interface OpenRouterStreamChunk {
+  choices?: Array<{
+    delta?: {
+      content?: string;
+    };
+    finish_reason?: string | null;
+  }>;
+  usage?: OpenRouterUsage;
+  error?: OpenRouterErrorResponse['error'];
+}
+
+export interface OpenRouterCompletion {
+  summary: string;
+  usage?: OpenRouterUsage;
+}
+
+/**
+ * Create appropriate error from OpenRouter API response
+ */
+export function createErrorFromResponse(status: number, errorData?: OpenRouterErrorResponse): Error {
+  const errorMessage = errorData?.error?.message || 'Unknown API error';
+
+  switch (status) {
+    case 400:
+      return new Error(`INVALID_REQUEST: ${errorMessage}`);
+    case 401:
+      return new Error(`INVALID_API_KEY: ${errorMessage}`);
+    case 403:
+      return new Error(`FORBIDDEN: ${errorMessage}`);
+    case 429:
+      return new Error(`RATE_LIMITED: ${errorMessage}`);
+    case 500:
+    case 502:
+    case 503:
+    case 504:
+      return new Error(`SERVICE_UNAVAILABLE: ${errorMessage}`);
+    default:
+      return new Error(`API_ERROR: ${errorMessage}`);
+  }
+}
+
+/**
+ * Convert an error event sent inside the stream. OpenRouter reports the
+ * HTTP-equivalent status in error.code; anything else is treated as an
+ * upstream failure.
+ */
+function createErrorFromEvent(error: OpenRouterErrorResponse['error']): Error {
+  const status = Number(error.code);
+  return createErrorFromResponse(Number.isInteger(status) ? status : 502, { error });
+}
+
+/**
+ * Read a streamed (SSE) chat completion, concatenating content deltas.
+ * Resolves as soon as the completion has finished and usage has been
+ * reported; the remainder of the response is still drained so the socket
+ * can return to the keep-alive agent.
+ *
+ * The request timeout only covers the wait for response headers, and
+ * keep-alive comments keep the socket active, so timeoutMs bounds the
+ * whole body: a stream that stalls is destroyed and rejected with
+ * REQUEST_TIMEOUT.
+ */
+export function readCompletionStream(stream: Readable, timeoutMs: number): Promise<OpenRouterCompletion> {
+  return new Promise((resolve, reject) => {
+    let buffered = '';
+    let summary = '';
+    let usage: OpenRouterUsage | undefined;
+    let finished = false;
+    let settled = false;
+
+    const settle = (error?: Error) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(deadline);
+      if (error) {
+        // The connection is unusable after a failure, so release it
+        stream.destroy();
+        reject(error);
+      } else {
+        resolve({ summary, usage });
+        stream.resume();
+      }
+    };
+
+    // Returns true once no further events are needed
+    const handleLine = (line: string): boolean => {
+      // Skip blank lines and SSE comments (OpenRouter sends keep-alives)
+      if (!line.startsWith('data:')) {
+        return false;
+      }
+
+      const payload = line.slice(5).trim();
+      if (payload === '[DONE]') {
+        return true;
+      }
+
+      let event: OpenRouterStreamChunk;
+      try {
+        event = JSON.parse(payload) as OpenRouterStreamChunk;
+      } catch {
+        // A corrupted event means the completion can't be trusted; report
+        // it as an upstream failure so the call is retried
+        throw new Error('SERVICE_UNAVAILABLE: malformed stream event');
+      }
+      if (event.error) {
+        throw createErrorFromEvent(event.error);
+      }
+
+      const choice = event.choices?.[0];
+      if (choice?.delta?.content) {
+        summary += choice.delta.content;
+      }
+      if (choice?.finish_reason) {
+        finished = true;
+      }
+      if (event.usage) {
+        usage = event.usage;
+      }
+
+      return finished && usage !== undefined;
+    };
+
+    const deadline = setTimeout(
+      () => settle(new Error(`REQUEST_TIMEOUT: no completion within ${timeoutMs}ms`)),
+      timeoutMs
+    );
+
+    stream.setEncoding('utf8');
+
+    stream.on('data', (chunk: string) => {
+      if (settled) return;
+      buffered += chunk;
+
+      try {
+        let newlineIndex = buffered.indexOf('\n');
+        while (newlineIndex >= 0) {
+          const line = buffered.slice(0, newlineIndex).trim();
+          buffered = buffered.slice(newlineIndex + 1);
+
+          if (handleLine(line)) {
+            settle();
+            return;
+          }
+
+          newlineIndex = buffered.indexOf('\n');
+        }
+      } catch (error) {
+        settle(error as Error);
+      }
+    });
+
+    stream.on('end', () => {
+      try {
+        handleLine(buffered.trim());
+        settle();
+      } catch (error) {
+        settle(error as Error);
+      }
+    });
+
+    // Socket failures mid-stream (ECONNRESET, aborted) are transient, so
+    // surface them as network errors the retry logic understands
+    stream.on('error', (error: Error) => settle(new Error(`NETWORK_ERROR: ${error.message}`)));
+
+    stream.on('close', () => settle(new Error('NETWORK_ERROR: stream closed before completion')));
+  });
+}
+
+/**
+ * Read and parse the JSON error body of a streamed response. Consuming the
+ * body to the end also frees the connection for reuse.
+ */
+export function readErrorBody(stream: Readable): Promise<OpenRouterErrorResponse | undefined> {
+  return new Promise((resolve) => {
+    let body = '';
+
+    stream.setEncoding('utf8');
+    stream.on('data', (chunk: string) => {
+      body += chunk;
+    });
+    stream.on('end', () => {
+      try {
+        resolve(JSON.parse(body) as OpenRouterErrorResponse);
+      } catch {
+        resolve(undefined);
+      }
+    });
+    stream.on('error', () => resolve(undefined));
+  });
+}
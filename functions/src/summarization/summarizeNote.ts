@@ -1,6 +1,7 @@
 import { onCall, HttpsError } from 'firebase-functions/v2/https';
 import { logger } from 'firebase-functions/v2';
 import * as admin from 'firebase-admin';
+import * as crypto from 'crypto';
 import { OpenRouterService } from '../services/openRouterService';
 import { Environment } from '../config/environment';
 
@@ -18,6 +19,12 @@ interface SummarizeNoteResponse {
   code?: string;
 }
 
+interface CachedSummary {
+  summary: string;
+  model: string;
+  expiresAt: admin.firestore.Timestamp;
+}
+
 interface UserUsageStats {
   dailyRequests: number;
   monthlyRequests: number;
@@ -29,8 +36,10 @@ interface UserUsageStats {
 }
 
 export const summarizeNote = onCall(
+  Environment.getRuntimeConfig(),
   async (request): Promise<SummarizeNoteResponse> => {
     const data = request.data as SummarizeNoteRequest;
+    const startTime = Date.now();
     
     try {
       // Verify user authentication
@@ -75,12 +84,13 @@ export const summarizeNote = onCall(
         );
       }
 
-      // Check rate limits and quotas (Requirements 3.4, 5.4)
-      await checkRateLimitsAndQuotas(data.userId);
-
-      // Verify note ownership by checking Firestore
+      // Check rate limits and quotas (Requirements 3.4, 5.4) and verify
+      // note ownership. The two reads are independent, so run them together.
       const noteRef = admin.firestore().collection('notes').doc(data.noteId);
-      const noteDoc = await noteRef.get();
+      const [, noteDoc] = await Promise.all([
+        checkRateLimitsAndQuotas(data.userId),
+        noteRef.get()
+      ]);
       
       if (!noteDoc.exists) {
         throw new HttpsError(
@@ -97,41 +107,56 @@ export const summarizeNote = onCall(
         );
       }
 
-      // Initialize OpenRouter service
-      const openRouterService = new OpenRouterService();
-      
-      // Generate summary using AI service with enhanced error handling
+      // Reuse an earlier summary when this user already summarized
+      // identical content
+      const cacheKey = createCacheKey(data.userId, data.content);
+      const cached = await getCachedSummary(cacheKey);
+
       let summary: string;
       let model = 'openai/gpt-3.5-turbo'; // Default model
-      
-      try {
-        summary = await openRouterService.generateSummary(data.content);
-      } catch (error) {
-        // Log the error for monitoring
-        console.error('AI summarization failed', {
-          userId: data.userId,
-          noteId: data.noteId,
-          contentLength: data.content.length,
-          error: error
-        });
-        
-        // Update usage stats even for failed requests to prevent abuse
-        await updateUsageStats(data.userId, false);
-        
-        // Re-throw the error (it's already properly formatted by OpenRouterService)
-        throw error;
-      }
+      const pendingWrites: Promise<unknown>[] = [];
 
-      // Save summary to Firestore (Requirements 2.1)
-      await noteRef.update({
-        summary: summary,
-        summaryTimestamp: admin.firestore.FieldValue.serverTimestamp(),
-        summaryOutdated: false,
-        summaryModel: model
-      });
+      if (cached) {
+        summary = cached.summary;
+        model = cached.model;
+      } else {
+        // Initialize OpenRouter service
+        const openRouterService = new OpenRouterService();
+
+        // Generate summary using AI service with enhanced error handling
+        try {
+          summary = await openRouterService.generateSummary(data.content);
+        } catch (error) {
+          // Log the error for monitoring
+          logger.error('AI summarization failed', {
+            userId: data.userId,
+            noteId: data.noteId,
+            contentLength: data.content.length,
+            error: error
+          });
+          
+          // Update usage stats even for failed requests to prevent abuse
+          await updateUsageStats(data.userId, false);
+          
+          // Re-throw the error (it's already properly formatted by OpenRouterService)
+          throw error;
+        }
 
-      // Update usage statistics for successful requests
-      await updateUsageStats(data.userId, true);
+        pendingWrites.push(cacheSummary(cacheKey, summary, model));
+      }
+
+      // Save summary to Firestore (Requirements 2.1), then count the request
+      // as successful only once the note write has gone through. The cache
+      // write is independent of both, so it runs alongside them.
+      await Promise.all([
+        noteRef.update({
+          summary: summary,
+          summaryTimestamp: admin.firestore.FieldValue.serverTimestamp(),
+          summaryOutdated: false,
+          summaryModel: model
+        }).then(() => updateUsageStats(data.userId, true)),
+        ...pendingWrites
+      ]);
 
       // Log successful summarization for monitoring
       logger.info('Summary generated successfully', {
@@ -139,7 +164,9 @@ export const summarizeNote = onCall(
         noteId: data.noteId,
         contentLength: data.content.length,
         summaryLength: summary.length,
-        model: model
+        model: model,
+        fromCache: cached !== null,
+        durationMs: Date.now() - startTime
       });
 
       return {
@@ -155,6 +182,7 @@ export const summarizeNote = onCall(
         userId: data?.userId,
         noteId: data?.noteId,
         contentLength: data?.content?.length,
+        durationMs: Date.now() - startTime,
         timestamp: new Date().toISOString()
       });
       
@@ -203,27 +231,30 @@ async function checkRateLimitsAndQuotas(userId: string): Promise<void> {
         stats = userStatsDoc.data() as UserUsageStats;
       }
       
-      // Reset counters if time windows have passed
-      const oneHourAgo = new Date(now.toDate().getTime() - 60 * 60 * 1000);
-      const oneMinuteAgo = new Date(now.toDate().getTime() - 60 * 1000);
-      const oneDayAgo = new Date(now.toDate().getTime() - 24 * 60 * 60 * 1000);
-      const oneMonthAgo = new Date(now.toDate().getTime() - 30 * 24 * 60 * 60 * 1000);
+      // Reset counters if time windows have passed. Compare epoch millis
+      // taken once rather than allocating a Date for every check.
+      const nowMs = now.toMillis();
+      const oneHourAgo = nowMs - 60 * 60 * 1000;
+      const oneMinuteAgo = nowMs - 60 * 1000;
+      const oneDayAgo = nowMs - 24 * 60 * 60 * 1000;
+      const oneMonthAgo = nowMs - 30 * 24 * 60 * 60 * 1000;
+      const lastRequestMs = stats.lastRequestTime.toMillis();
       
-      if (stats.hourlyResetTime.toDate() < oneHourAgo) {
+      if (stats.hourlyResetTime.toMillis() < oneHourAgo) {
         stats.requestsInLastHour = 0;
         stats.hourlyResetTime = now;
       }
       
-      if (stats.minutelyResetTime.toDate() < oneMinuteAgo) {
+      if (stats.minutelyResetTime.toMillis() < oneMinuteAgo) {
         stats.requestsInLastMinute = 0;
         stats.minutelyResetTime = now;
       }
       
-      if (stats.lastRequestTime.toDate() < oneDayAgo) {
+      if (lastRequestMs < oneDayAgo) {
         stats.dailyRequests = 0;
       }
       
-      if (stats.lastRequestTime.toDate() < oneMonthAgo) {
+      if (lastRequestMs < oneMonthAgo) {
         stats.monthlyRequests = 0;
       }
       
@@ -300,4 +331,69 @@ async function updateUsageStats(userId: string, success: boolean): Promise<void>
       error
     });
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Create the summary cache key. Entries are scoped to the user so one
+ * user's note content is never served to, or shared with, another user.
+ */
+function createCacheKey(userId: string, content: string): string {
+  const contentHash = crypto.createHash('sha256').update(content.trim()).digest('hex');
+  return `${userId}:${contentHash}`;
+}
+
+/**
+ * Look up a previously generated summary for the same content
+ */
+async function getCachedSummary(cacheKey: string): Promise<CachedSummary | null> {
+  const cacheConfig = Environment.getSummaryCacheConfig();
+
+  try {
+    const cacheDoc = await admin.firestore()
+      .collection(cacheConfig.collection)
+      .doc(cacheKey)
+      .get();
+
+    if (!cacheDoc.exists) {
+      return null;
+    }
+
+    const entry = cacheDoc.data() as CachedSummary;
+    if (entry.expiresAt.toMillis() <= Date.now()) {
+      return null;
+    }
+
+    return entry;
+  } catch (error) {
+    // A cache miss only costs an API call, so never fail the request here
+    logger.warn('Failed to read summary cache:', {
+      cacheKey,
+      error
+    });
+    return null;
+  }
+}
+
+/**
+ * Store a generated summary keyed by content hash
+ */
+async function cacheSummary(cacheKey: string, summary: string, model: string): Promise<void> {
+  const cacheConfig = Environment.getSummaryCacheConfig();
+
+  try {
+    await admin.firestore()
+      .collection(cacheConfig.collection)
+      .doc(cacheKey)
+      .set({
+        summary: summary,
+        model: model,
+        createdAt: admin.firestore.FieldValue.serverTimestamp(),
+        expiresAt: admin.firestore.Timestamp.fromMillis(Date.now() + cacheConfig.ttlMs)
+      });
+  } catch (error) {
+    logger.warn('Failed to write summary cache:', {
+      cacheKey,
+      error
+    });
+  }
+}
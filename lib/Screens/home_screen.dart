@@ -18,10 +18,23 @@ class HomeScreen extends StatefulWidget {
 }
 
 class _HomeScreenState extends State<HomeScreen> {
+  static final DateFormat _updatedFormat = DateFormat('MMM d');
+  static const TextStyle _categoryStyle = TextStyle(
+    color: Colors.white,
+    fontSize: 16,
+    fontWeight: FontWeight.w600,
+  );
+
   List<Note> _notes = [];
   Set<String> _categories = {'All'};
+  // Number of notes per formatted category, so a delete can tell whether
+  // its category is still in use without rescanning the notes
+  Map<String, int> _categoryCounts = {};
   String _selectedCategory = 'All';
   bool _isLoading = true;
+  // Card previews keyed by note id, so the Quill JSON of each note is
+  // decoded once per load instead of on every rebuild
+  final Map<String, String> _previewCache = {};
 
   @override
   void initState() {
@@ -47,23 +60,18 @@ class _HomeScreenState extends State<HomeScreen> {
           .map((doc) => Note.fromFirestore(doc))
           .toList();
 
-      // Extract unique categories
-      final categories = {'All'};
-    for (var note in notes) {
-      if (note.category.isNotEmpty) {
-        categories.add(note.category[0].toUpperCase() + note.category.substring(1).toLowerCase());
-      }
-    }
-
-    setState(() {
-      _notes = notes;
-      _categories = categories;
-      _isLoading = false;
-    });
+      setState(() {
+        _notes = notes;
+        _previewCache.clear();
+        _categoryCounts = _countCategories(notes);
+        _categories = {'All', ..._categoryCounts.keys};
+        _isLoading = false;
+      });
     } catch (e) {
       print('Error loading notes: $e');
       setState(() {
         _notes = [];
+        _categoryCounts = {};
         _categories = {'All'};
         _isLoading = false;
       });
@@ -83,6 +91,23 @@ class _HomeScreenState extends State<HomeScreen> {
     _loadNotes();
   }
 
+  // Normalize category names for display, e.g. "work" -> "Work"
+  String _formatCategory(String category) {
+    return category[0].toUpperCase() + category.substring(1).toLowerCase();
+  }
+
+  // Count notes per unique category
+  Map<String, int> _countCategories(List<Note> notes) {
+    final counts = <String, int>{};
+    for (final note in notes) {
+      if (note.category.isNotEmpty) {
+        final category = _formatCategory(note.category);
+        counts[category] = (counts[category] ?? 0) + 1;
+      }
+    }
+    return counts;
+  }
+
   // Calculate text size for dynamic category button width
   Size _calculateTextSize(
     String text,
@@ -128,11 +153,9 @@ class _HomeScreenState extends State<HomeScreen> {
   @override
   Widget build(BuildContext context) {
     final theme = Theme.of(context);
-    final categoryStyle = TextStyle(
-      color: Colors.white,
-      fontSize: 16,
-      fontWeight: FontWeight.w600,
-    );
+    // Filter and sort once per build rather than once per list item
+    final filteredNotes = _getFilteredNotes();
+    final sortedCategories = _categories.toList()..sort();
 
     return RefreshIndicator(
       onRefresh: _loadNotes,
@@ -149,13 +172,12 @@ class _HomeScreenState extends State<HomeScreen> {
                         height: 100,
                         child: ListView.builder(
                           scrollDirection: Axis.horizontal,
-                          itemCount: _categories.length,
+                          itemCount: sortedCategories.length,
                           itemBuilder: (context, index) {
-                            final category = List<String>.from(_categories)..sort();
-                            final catName = category[index];
+                            final catName = sortedCategories[index];
                             final isSelected = _selectedCategory == catName;
 
-                            final textSize = _calculateTextSize(catName, categoryStyle);
+                            final textSize = _calculateTextSize(catName, _categoryStyle);
                             final buttonWidth = textSize.width + 60;
 
                             return Padding(
@@ -192,7 +214,7 @@ class _HomeScreenState extends State<HomeScreen> {
                                   alignment: Alignment.center,
                                   child: Text(
                                     catName,
-                                    style: categoryStyle.copyWith(
+                                    style: _categoryStyle.copyWith(
                                       color: isSelected
                                           ? Theme.of(context).colorScheme.onPrimary
                                           : Theme.of(context).colorScheme.onSurfaceVariant,
@@ -210,7 +232,7 @@ class _HomeScreenState extends State<HomeScreen> {
 
                       // Notes List
                       Expanded(
-                        child: _getFilteredNotes().isEmpty
+                        child: filteredNotes.isEmpty
                             ? Center(
                                 child: Text(
                                   'No notes in "$_selectedCategory"',
@@ -218,9 +240,9 @@ class _HomeScreenState extends State<HomeScreen> {
                                 ),
                               )
                             : ListView.builder(
-                                itemCount: _getFilteredNotes().length,
+                                itemCount: filteredNotes.length,
                                 itemBuilder: (context, index) {
-                                  final note = _getFilteredNotes()[index];
+                                  final note = filteredNotes[index];
                                   return _buildNoteCard(note);
                                 },
                               ),
@@ -244,10 +266,12 @@ class _HomeScreenState extends State<HomeScreen> {
     final theme = Theme.of(context);
     
     // Extract plain text from content
-    final plainTextContent = _extractPlainText(note.content);
-    final previewText = plainTextContent.length > 120
-        ? '${plainTextContent.substring(0, 120)}...'
-        : plainTextContent;
+    final previewText = _previewCache.putIfAbsent(note.id, () {
+      final plainTextContent = _extractPlainText(note.content);
+      return plainTextContent.length > 120
+          ? '${plainTextContent.substring(0, 120)}...'
+          : plainTextContent;
+    });
 
     return Dismissible(
       key: Key(note.id),
@@ -293,15 +317,21 @@ class _HomeScreenState extends State<HomeScreen> {
           
           setState(() {
             _notes.removeWhere((n) => n.id == note.id);
+            _previewCache.remove(note.id);
             
-            // Recalculate categories after deletion
-            final categories = {'All'};
-            for (var remainingNote in _notes) {
-              if (remainingNote.category.isNotEmpty) {
-                categories.add(remainingNote.category[0].toUpperCase() + remainingNote.category.substring(1).toLowerCase());
+            // Only drop the deleted note's category if no other note uses it
+            if (note.category.isNotEmpty) {
+              final category = _formatCategory(note.category);
+              final remaining = (_categoryCounts[category] ?? 1) - 1;
+              if (remaining > 0) {
+                _categoryCounts[category] = remaining;
+              } else {
+                _categoryCounts.remove(category);
+                if (category != 'All') {
+                  _categories.remove(category);
+                }
               }
             }
-            _categories = categories;
             
             // If the current selected category no longer exists, switch to 'All'
             if (!_categories.contains(_selectedCategory)) {
@@ -504,7 +534,7 @@ class _HomeScreenState extends State<HomeScreen> {
 
                     // Last updated
                     Text(
-                      'Updated ${DateFormat('MMM d').format(note.updatedAt)}',
+                      'Updated ${_updatedFormat.format(note.updatedAt)}',
                       style: TextStyle(
                         fontSize: 12,
                         color: Theme.of(context).colorScheme.onSurfaceVariant,
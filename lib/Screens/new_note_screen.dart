@@ -157,14 +157,16 @@ class _NewNoteScreenState extends ConsumerState<NewNoteScreen> {
         noteData['reminderDate'] = Timestamp.fromDate(_reminderDate!);
       }
 
-      await FirebaseFirestore.instance.collection('notes').add(noteData);
+      final docRef = await FirebaseFirestore.instance.collection('notes').add(noteData);
 
       // Schedule notification if reminder date is set and notifications are enabled
       if (_reminderDate != null && _reminderDate!.isAfter(DateTime.now())) {
         final notificationService = ref.read(notiServiceProvider);
         final noteTitle = _titleController.text.trim().isEmpty ? 'Untitled' : _titleController.text.trim();
         final plainTextContent = _quillController.document.toPlainText().trim();
-        final notificationId = noteTitle.hashCode;
+        // Derive the id from the note's document id; two notes with the
+        // same title would otherwise share an id and replace each other
+        final notificationId = docRef.id.hashCode;
         
         await notificationService.scheduleNotification(
           id: notificationId,
@@ -79,23 +79,24 @@ class _NoteEditorScreenState extends State<NoteEditorScreen> {
   }
 
   void _onContentChanged() {
+    // Runs on every keystroke; once there is no summary to invalidate, or
+    // it is already marked outdated, there is nothing left to compute
+    final note = _currentNote;
+    if (note == null || !note.hasSummary || note.summaryOutdated) return;
+
     // Implement summary staleness detection on content changes
-    if (_currentNote != null && _currentNote!.hasSummary) {
-      final currentContent = _contentController.text.trim();
-      final originalContent = _originalContent ?? '';
-      
-      // Check if content has changed significantly (more than 10% difference)
-      final contentDiff = (currentContent.length - originalContent.length).abs();
-      final changePercentage = originalContent.isEmpty ? 1.0 : contentDiff / originalContent.length;
-      
-      if (changePercentage > 0.1 || currentContent != originalContent) {
-        // Mark summary as outdated if content changed significantly
-        if (!_currentNote!.summaryOutdated) {
-          setState(() {
-            _currentNote = _currentNote!.copyWith(summaryOutdated: true);
-          });
-        }
-      }
+    final currentContent = _contentController.text.trim();
+    final originalContent = _originalContent ?? '';
+    
+    // Check if content has changed significantly (more than 10% difference)
+    final contentDiff = (currentContent.length - originalContent.length).abs();
+    final changePercentage = originalContent.isEmpty ? 1.0 : contentDiff / originalContent.length;
+    
+    if (changePercentage > 0.1 || currentContent != originalContent) {
+      // Mark summary as outdated if content changed significantly
+      setState(() {
+        _currentNote = note.copyWith(summaryOutdated: true);
+      });
     }
   }
 
@@ -119,29 +120,21 @@ class _NoteEditorScreenState extends State<NoteEditorScreen> {
 
     try {
       final user = FirebaseAuth.instance.currentUser!;
-      final noteData = {
-        'title': _titleController.text.trim().isEmpty 
-            ? 'Untitled' 
-            : _titleController.text.trim(),
-        'content': _contentController.text.trim(),
-        'userId': user.uid,
-        'updatedAt': FieldValue.serverTimestamp(),
-      };
-
-      // Handle summary staleness detection on content changes
-      if (_currentNote != null && _currentNote!.hasSummary) {
-        final currentContent = _contentController.text.trim();
-        final originalContent = _originalContent ?? '';
-        
-        if (currentContent != originalContent) {
-          noteData['summaryOutdated'] = true;
-        }
-      }
+      final title = _titleController.text.trim().isEmpty 
+          ? 'Untitled' 
+          : _titleController.text.trim();
+      final content = _contentController.text.trim();
 
       if (widget.noteId == null) {
         // Create new note
-        noteData['createdAt'] = FieldValue.serverTimestamp();
-        noteData['summaryOutdated'] = false;
+        final Map<String, dynamic> noteData = {
+          'title': title,
+          'content': content,
+          'userId': user.uid,
+          'createdAt': FieldValue.serverTimestamp(),
+          'updatedAt': FieldValue.serverTimestamp(),
+          'summaryOutdated': false,
+        };
         final docRef = await FirebaseFirestore.instance.collection('notes').add(noteData);
         
         // Update current note with new ID
@@ -153,17 +146,43 @@ class _NoteEditorScreenState extends State<NoteEditorScreen> {
           }, docRef.id);
         });
       } else {
-        // Update existing note
+        // Only write the fields that changed; userId and unchanged
+        // title/content are not rewritten on every save
+        final Map<String, dynamic> updates = {
+          'updatedAt': FieldValue.serverTimestamp(),
+        };
+
+        // Compare both fields against the same snapshot: the loaded note,
+        // or the route arguments if it hasn't loaded
+        final savedNote = _currentNote;
+        final savedTitle = savedNote?.title ?? widget.initialTitle;
+        final savedContent = savedNote?.content ?? widget.initialContent;
+
+        if (title != savedTitle) {
+          updates['title'] = title;
+        }
+
+        // Handle summary staleness detection on content changes
+        if (content != savedContent) {
+          updates['content'] = content;
+          if (savedNote != null && savedNote.hasSummary) {
+            updates['summaryOutdated'] = true;
+          }
+        }
+
         await FirebaseFirestore.instance
             .collection('notes')
             .doc(widget.noteId)
-            .update(noteData);
-        
-        // Update original content reference
-        _originalContent = _contentController.text.trim();
+            .update(updates);
         
-        // Reload note to get updated data
-        await _loadNote();
+        // The note is not read back, so move the baseline to what was
+        // just written
+        _currentNote = savedNote?.copyWith(
+          title: title,
+          content: content,
+          summaryOutdated: updates['summaryOutdated'] as bool?,
+        );
+        _originalContent = content;
       }
 
       Navigator.pop(context);
@@ -22,6 +22,8 @@ class ReminderScreen extends ConsumerStatefulWidget {
 }
 
 class _ReminderScreenState extends ConsumerState<ReminderScreen> {
+  static final DateFormat _timeFormat = DateFormat('h:mm a');
+
   Map<String, List<Note>> _reminders = {
     'overdue': [],
     'today': [],
@@ -54,14 +56,17 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
       final todayStart = DateTime(now.year, now.month, now.day);
       final tomorrowStart = todayStart.add(const Duration(days: 1));
 
-      // Use the simple query to avoid index issues
+      // Ordering by reminderDate excludes notes that never had a reminder,
+      // so only reminder notes are fetched and they arrive already sorted.
+      // Requires the (userId, reminderDate) index from firestore.indexes.json,
+      // deployed with `firebase deploy --only firestore:indexes`.
       final query = FirebaseFirestore.instance
           .collection('notes')
-          .where('userId', isEqualTo: user.uid);
+          .where('userId', isEqualTo: user.uid)
+          .orderBy('reminderDate');
 
       final snapshot = await query.get();
       
-      // Filter notes with reminders in memory
       final List<Note> notes = snapshot.docs
           .map((doc) => Note.fromFirestore(doc))
           .where((note) => note.reminderDate != null)
@@ -89,11 +94,6 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
         }
       }
 
-      // Sort each category by reminder date
-      for (final category in categorized.values) {
-        category.sort((a, b) => a.reminderDate!.compareTo(b.reminderDate!));
-      }
-
       setState(() {
         _reminders = categorized;
         _isLoading = false;
@@ -145,6 +145,7 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
   @override
   Widget build(BuildContext context) {
     final theme = Theme.of(context);
+    final displayedNotes = _getDisplayedNotes();
     
     return Scaffold(
       appBar: AppBar(
@@ -158,7 +159,7 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
       ),
       body: _isLoading
           ? const Center(child: CircularProgressIndicator())
-          : _getDisplayedNotes().isEmpty && _selectedTab == 'All'
+          : displayedNotes.isEmpty && _selectedTab == 'All'
               ? _buildEmptyState()
               : Column(
                   children: [
@@ -168,7 +169,7 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
                         onRefresh: _loadReminders,
                         child: ListView(
                           padding: const EdgeInsets.all(12),
-                          children: _buildReminderSections(),
+                          children: _buildReminderSections(displayedNotes),
                         ),
                       ),
                     ),
@@ -238,7 +239,7 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
     );
   }
 
-  List<Widget> _buildReminderSections() {
+  List<Widget> _buildReminderSections(List<Note> displayedNotes) {
     final List<Widget> sections = [];
     
     if (_selectedTab == 'All') {
@@ -255,9 +256,8 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
         sections.add(_buildSection('Later', _reminders['future']!, Colors.blue));
       }
     } else {
-      final notes = _getDisplayedNotes();
-      if (notes.isNotEmpty) {
-        sections.add(_buildSection(_selectedTab, notes, null));
+      if (displayedNotes.isNotEmpty) {
+        sections.add(_buildSection(_selectedTab, displayedNotes, null));
       }
     }
 
@@ -305,7 +305,6 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
   }
 
   Widget _buildReminderTile(Note note, Color accentColor) {
-    final timeFormat = DateFormat('h:mm a');
     final isOverdue = note.reminderDate!.isBefore(DateTime.now());
     
     return Card(
@@ -333,7 +332,7 @@ class _ReminderScreenState extends ConsumerState<ReminderScreen> {
           children: [
             const SizedBox(height: 4),
             Text(
-              timeFormat.format(note.reminderDate!),
+              _timeFormat.format(note.reminderDate!),
               style: TextStyle(
                 color: isOverdue ? Colors.red : accentColor,
                 fontWeight: FontWeight.w500,
@@ -12,6 +12,8 @@ class SearchScreen extends StatefulWidget {
 }
 
 class _SearchScreenState extends State<SearchScreen> {
+  static final DateFormat _updatedFormat = DateFormat('MMM d, yyyy');
+
   final TextEditingController _searchController = TextEditingController();
   String _selectedTab = 'All'; // All, Category, Tags
   String _searchQuery = '';
@@ -53,6 +55,21 @@ class _SearchScreenState extends State<SearchScreen> {
     final user = FirebaseAuth.instance.currentUser!;
     final lowerQuery = query.toLowerCase();
 
+    // Search runs on every keystroke, so match partial tags. Tags are
+    // stored trimmed and lowercased; a leading '#' is optional.
+    var tagQuery = lowerQuery.trim();
+    if (tagQuery.startsWith('#')) tagQuery = tagQuery.substring(1).trim();
+
+    // A bare '#' leaves nothing to match, so treat it like a blank query
+    // instead of matching every tagged note
+    if (_selectedTab == 'Tags' && tagQuery.isEmpty) {
+      setState(() {
+        _searchResults = [];
+        _isSearching = false;
+      });
+      return;
+    }
+
     try {
       final notesSnapshot = await FirebaseFirestore.instance
           .collection('notes')
@@ -74,7 +91,7 @@ class _SearchScreenState extends State<SearchScreen> {
         }).toList();
       } else if (_selectedTab == 'Tags') {
         filteredNotes = allNotes.where((note) {
-          return note.tags.any((tag) => tag.toLowerCase().contains(lowerQuery));
+          return note.tags.any((tag) => tag.toLowerCase().contains(tagQuery));
         }).toList();
       }
 
@@ -331,7 +348,7 @@ class _SearchScreenState extends State<SearchScreen> {
 
                 // Updated time
                 Text(
-                  DateFormat('MMM d, yyyy').format(note.updatedAt),
+                  _updatedFormat.format(note.updatedAt),
                   style: TextStyle(
                     fontSize: 12,
                     color: Theme.of(context).colorScheme.onSurfaceVariant,
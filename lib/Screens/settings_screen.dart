@@ -162,18 +162,17 @@ class _SettingsScreenState extends ConsumerState<SettingsScreen> {
 
         debugPrint('Firestore updated successfully');
 
-        // Update local profile
+        // Update local profile with the merged fields instead of re-reading
+        // the document we just wrote
         setState(() {
           profile = {
             ...profile ?? {},
             'profile_url': imageUrl,
+            'email': user.email,
             'isUploading': false,
           };
         });
 
-        // Refresh to ensure consistency
-        _refreshProfile();
-
         if (mounted) {
           ScaffoldMessenger.of(context).showSnackBar(
             const SnackBar(
@@ -2,6 +2,7 @@ import 'package:flutter/material.dart';
 import 'package:font_awesome_flutter/font_awesome_flutter.dart';
 import 'package:firebase_auth/firebase_auth.dart';
 import 'package:flutter_secure_storage/flutter_secure_storage.dart';
+import '../config/app_config.dart';
 import '../services/auth_service.dart';
 import 'login_screen.dart';
 import 'tabs_screen.dart';
@@ -181,8 +182,7 @@ class _SignUpScreenState extends State<SignUpScreen> {
                         if (value == null || value.trim().isEmpty) {
                           return 'Please enter your email';
                         }
-                        if (!RegExp(r'^[\w-\.]+@([\w-]+\.)+[\w-]{2,4}$')
-                            .hasMatch(value.trim())) {
+                        if (!AppConfig.emailPattern.hasMatch(value.trim())) {
                           return 'Enter a valid email';
                         }
                         return null;
@@ -1,6 +1,7 @@
 class AppConfig {
   // OpenRouter AI API Configuration
-  static const String openRouterApiKey = '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';
+  // Provided at build time: flutter run --dart-define=OPENROUTER_API_KEY=...
+  static const String openRouterApiKey = String.fromEnvironment('OPENROUTER_API_KEY');
   static const String openRouterBaseUrl = 'https://openrouter.ai/api/v1';
   static const String defaultModel = 'openai/gpt-4o-mini';
   
@@ -14,4 +15,7 @@ class AppConfig {
   static const int maxSummaryTokens = 150;
   static const int maxShortSummaryTokens = 50;
   static const double summaryTemperature = 0.3;
+
+  // Validation (compiled once, shared by the login, signup and reset forms)
+  static final RegExp emailPattern = RegExp(r'^[\w-\.]+@([\w-]+\.)+[\w-]{2,4}$');
 }
\ No newline at end of file
@@ -1,3 +1,4 @@
+import 'package:flutter/foundation.dart';
 import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import 'package:google_fonts/google_fonts.dart';
@@ -174,12 +175,10 @@ class _AuthWrapperState extends State<AuthWrapper> {
   }
 
   void _checkCurrentUser() {
+    if (!kDebugMode) return;
+
     final user = FirebaseAuth.instance.currentUser;
-    if (user != null) {
-      print('User already signed in: ${user.email}');
-    } else {
-      print('No user currently signed in');
-    }
+    print(user != null ? 'User already signed in' : 'No user currently signed in');
   }
 
   @override
@@ -187,8 +186,6 @@ class _AuthWrapperState extends State<AuthWrapper> {
     return StreamBuilder<User?>(
       stream: FirebaseAuth.instance.authStateChanges(),
       builder: (context, snapshot) {
-        print('Auth state changed: ${snapshot.data?.email ?? 'No user'}');
-        
         if (snapshot.connectionState == ConnectionState.waiting) {
           return const SplashScreen();
         }
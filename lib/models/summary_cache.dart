@@ -41,11 +41,23 @@ class SummaryCacheEntry {
     };
   }
 
+  // Most recent input and digest. The same note content is usually hashed
+  // repeatedly (cache lookups, validity checks, then the put after a
+  // summary), so reuse the digest instead of re-encoding and re-hashing.
+  static String? _lastHashedContent;
+  static String? _lastContentHash;
+
   /// Creates a content hash from note content for change detection
   static String createContentHash(String content) {
+    if (_lastContentHash != null && content == _lastHashedContent) {
+      return _lastContentHash!;
+    }
+
     final bytes = utf8.encode(content.trim());
-    final digest = sha256.convert(bytes);
-    return digest.toString();
+    final digest = sha256.convert(bytes).toString();
+    _lastHashedContent = content;
+    _lastContentHash = digest;
+    return digest;
   }
 
   @override
@@ -129,8 +141,11 @@ class SummaryCache {
         cacheData[entry.key] = entry.value.toJson();
       }
 
-      await _prefs.setString(_cacheKey, jsonEncode(cacheData));
-      await _prefs.setStringList(_accessOrderKey, _accessOrder.toList());
+      // Persist both keys in one round of platform writes
+      await Future.wait([
+        _prefs.setString(_cacheKey, jsonEncode(cacheData)),
+        _prefs.setStringList(_accessOrderKey, _accessOrder.toList()),
+      ]);
     } catch (e) {
       // Silently fail - cache is not critical
     }
@@ -207,8 +222,10 @@ class SummaryCache {
   Future<void> clear() async {
     _cache.clear();
     _accessOrder.clear();
-    await _prefs.remove(_cacheKey);
-    await _prefs.remove(_accessOrderKey);
+    await Future.wait([
+      _prefs.remove(_cacheKey),
+      _prefs.remove(_accessOrderKey),
+    ]);
   }
 
   /// Updates the access order for LRU tracking
@@ -12,6 +12,9 @@ class AISummaryService {
     'microsoft/phi-3-mini-128k-instruct:free',
   ];
 
+  static final RegExp _summaryPrefixPattern =
+      RegExp(r'^(Summary:|AI Summary:)', caseSensitive: false);
+
   /// Generate a summary for the given note content
   Future<String> generateSummary(String content, String title) async {
     // Check if content is long enough for summarization
@@ -23,12 +26,15 @@ class AISummaryService {
     for (int i = 0; i < _fallbackModels.length; i++) {
       final model = _fallbackModels[i];
       try {
-        print('Trying AI model: $model');
         final summary = await _generateWithModel(content, title, model);
-        print('Successfully generated summary with model: $model');
+        if (kDebugMode) {
+          print('Generated summary with model: $model');
+        }
         return summary;
       } catch (e) {
-        print('Model $model failed: $e');
+        if (kDebugMode) {
+          print('Model $model failed: $e');
+        }
         if (i == _fallbackModels.length - 1) {
           // Last model failed, rethrow the error
           rethrow;
@@ -46,16 +52,10 @@ class AISummaryService {
       // Create the prompt similar to the working Python implementation
       final prompt = 'Summarize this note clearly and concisely in 2-4 sentences:\n\nTitle: $title\n\nContent: $content';
 
-      print('Making API request to OpenRouter...');
-      print('Model: $model');
-      print('API URL: ${AppConfig.openRouterBaseUrl}/chat/completions');
-      print('Content length: ${content.length}');
-      print('Using API key: ${AppConfig.openRouterApiKey.substring(0, 20)}...');
-
       final response = await http.post(
         Uri.parse('${AppConfig.openRouterBaseUrl}/chat/completions'),
         headers: {
-          'Authorization': 'Bearer ${AppConfig.openRouterApiKey}', // Already has "Bearer " prefix
+          'Authorization': 'Bearer ${AppConfig.openRouterApiKey}',
           'Content-Type': 'application/json',
           'HTTP-Referer': AppConfig.appUrl,
           'X-Title': AppConfig.appName,
@@ -73,8 +73,9 @@ class AISummaryService {
         }),
       );
 
-      print('API Response Status: ${response.statusCode}');
-      print('API Response Body: ${response.body}');
+      if (kDebugMode) {
+        print('OpenRouter response ${response.statusCode} for $model (${content.length} chars in)');
+      }
 
       if (response.statusCode == 200) {
         final data = jsonDecode(response.body);
@@ -83,7 +84,7 @@ class AISummaryService {
           String summary = data['choices'][0]['message']['content'].toString().trim();
           
           // Clean up the summary - remove any prefixes
-          summary = summary.replaceAll(RegExp(r'^(Summary:|AI Summary:)', caseSensitive: false), '').trim();
+          summary = summary.replaceAll(_summaryPrefixPattern, '').trim();
           if (summary.startsWith('"') && summary.endsWith('"')) {
             summary = summary.substring(1, summary.length - 1);
           }
@@ -113,9 +114,8 @@ class AISummaryService {
         }
       }
     } catch (e) {
-      print('AI Error: $e'); // Enhanced debug logging
       if (kDebugMode) {
-        print('Full error details: $e');
+        print('AI Error: $e');
       }
       rethrow;
     }
@@ -176,9 +176,8 @@ class AISummaryService {
         throw Exception('Failed to generate short summary (${response.statusCode})');
       }
     } catch (e) {
-      print('Short Summary Error: $e');
       if (kDebugMode) {
-        print('Short Summary Error details: $e');
+        print('Short Summary Error: $e');
       }
       rethrow;
     }
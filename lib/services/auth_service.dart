@@ -1,4 +1,5 @@
 import 'package:firebase_auth/firebase_auth.dart';
+import 'package:flutter/foundation.dart';
 import 'package:google_sign_in/google_sign_in.dart';
 import 'package:flutter_secure_storage/flutter_secure_storage.dart';
 
@@ -43,42 +44,36 @@ class AuthService {
   // Google Sign In with forced account selection
   Future<User?> signInWithGoogle() async {
     try {
-      print('Starting Google Sign-In process...');
-      
       // Clear any existing sign-in to force account selection
       await _googleSignIn.signOut();
       
-      print('Attempting Google Sign-In...');
       final GoogleSignInAccount? googleUser = await _googleSignIn.signIn();
       
       if (googleUser == null) {
-        print('Google Sign-In cancelled by user');
+        if (kDebugMode) {
+          print('Google Sign-In cancelled by user');
+        }
         return null;
       }
 
-      print('Google account selected: ${googleUser.email}');
-      print('Getting authentication details...');
-      
       final GoogleSignInAuthentication googleAuth = await googleUser.authentication;
       
       if (googleAuth.accessToken == null || googleAuth.idToken == null) {
         throw Exception('Failed to get Google authentication tokens');
       }
 
-      print('Creating Firebase credential...');
       final credential = GoogleAuthProvider.credential(
         accessToken: googleAuth.accessToken,
         idToken: googleAuth.idToken,
       );
       
-      print('Signing in to Firebase...');
       UserCredential cred = await _auth.signInWithCredential(credential);
-      
-      print('Firebase sign-in successful');
       await _saveToken();
       return cred.user;
     } catch (e) {
-      print('Google Sign-In error: $e');
+      if (kDebugMode) {
+        print('Google Sign-In error: $e');
+      }
       rethrow;
     }
   }
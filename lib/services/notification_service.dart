@@ -12,8 +12,28 @@ class NotiService {
   final FlutterLocalNotificationsPlugin _notificationsPlugin =
       FlutterLocalNotificationsPlugin();
 
+  // Shared by every show/schedule call so the channel config is built once
+  static const NotificationDetails _notificationDetails = NotificationDetails(
+    android: AndroidNotificationDetails(
+      'smart_notes_channel',
+      'Smart Notes Notifications',
+      channelDescription: 'Channel for Smart Notes reminders and updates',
+      importance: Importance.max,
+      priority: Priority.high,
+      showWhen: true,
+      icon: '@mipmap/ic_launcher',
+      playSound: true,
+      enableVibration: true,
+    ),
+  );
+
   bool _isInitialized = false;
 
+  // Result of the exact alarm permission request, cached after the first
+  // schedule so later reminders skip the platform channel round trip.
+  // Refreshed whenever scheduling fails, since the user can revoke it.
+  bool? _exactAlarmGranted;
+
   Future<void> initNotification() async {
     if (_isInitialized) return;
 
@@ -84,27 +104,11 @@ class NotiService {
     }
 
     try {
-      const AndroidNotificationDetails androidDetails =
-          AndroidNotificationDetails(
-        'smart_notes_channel',
-        'Smart Notes Notifications',
-        channelDescription: 'Channel for Smart Notes reminders and updates',
-        importance: Importance.max,
-        priority: Priority.high,
-        showWhen: true,
-        icon: '@mipmap/ic_launcher',
-        playSound: true,
-        enableVibration: true,
-      );
-
-      const NotificationDetails notificationDetails =
-          NotificationDetails(android: androidDetails);
-
       await _notificationsPlugin.show(
         DateTime.now().millisecondsSinceEpoch ~/ 1000,
         title,
         body,
-        notificationDetails,
+        _notificationDetails,
       );
       
       print('Notification shown: $title - $body');
@@ -135,48 +139,76 @@ class NotiService {
 
     try {
       // Request exact alarm permission only when needed
-      final androidPlugin = _notificationsPlugin
-          .resolvePlatformSpecificImplementation<AndroidFlutterLocalNotificationsPlugin>();
+      await _ensureExactAlarmPermission();
+
+      await _zonedSchedule(id, title, body, scheduledDate,
+          AndroidScheduleMode.exactAllowWhileIdle);
       
-      if (androidPlugin != null) {
-        final exactAlarmGranted = await androidPlugin.requestExactAlarmsPermission();
-        print('Exact alarm permission granted: $exactAlarmGranted');
-        
-        if (exactAlarmGranted != true) {
-          print('Exact alarm permission denied - notification may not work precisely');
+      print('Notification scheduled: $title for ${scheduledDate.toString()}');
+    } catch (e) {
+      // The cached grant goes stale if the user revokes "Alarms & reminders"
+      // while the app is running, so re-check it before giving up
+      if (await _exactAlarmRevoked()) {
+        try {
+          await _zonedSchedule(id, title, body, scheduledDate,
+              AndroidScheduleMode.inexactAllowWhileIdle);
+          print('Exact alarm permission revoked - scheduled inexact notification: $title');
+        } catch (e) {
+          print('Error scheduling notification: $e');
         }
+      } else {
+        print('Error scheduling notification: $e');
       }
+    }
+  }
 
-      const AndroidNotificationDetails androidDetails =
-          AndroidNotificationDetails(
-        'smart_notes_channel',
-        'Smart Notes Notifications',
-        channelDescription: 'Channel for Smart Notes reminders and updates',
-        importance: Importance.max,
-        priority: Priority.high,
-        showWhen: true,
-        icon: '@mipmap/ic_launcher',
-        playSound: true,
-        enableVibration: true,
-      );
+  Future<void> _zonedSchedule(
+    int id,
+    String title,
+    String body,
+    DateTime scheduledDate,
+    AndroidScheduleMode scheduleMode,
+  ) {
+    return _notificationsPlugin.zonedSchedule(
+      id,
+      title,
+      body,
+      tz.TZDateTime.from(scheduledDate, tz.local),
+      _notificationDetails,
+      androidScheduleMode: scheduleMode,
+      uiLocalNotificationDateInterpretation:
+          UILocalNotificationDateInterpretation.absoluteTime,
+    );
+  }
 
-      const NotificationDetails notificationDetails =
-          NotificationDetails(android: androidDetails);
+  // Refreshes the cached grant from the platform; true if exact alarms
+  // are no longer allowed
+  Future<bool> _exactAlarmRevoked() async {
+    final androidPlugin = _notificationsPlugin
+        .resolvePlatformSpecificImplementation<AndroidFlutterLocalNotificationsPlugin>();
+    if (androidPlugin == null) return false;
 
-      await _notificationsPlugin.zonedSchedule(
-        id,
-        title,
-        body,
-        tz.TZDateTime.from(scheduledDate, tz.local),
-        notificationDetails,
-        androidScheduleMode: AndroidScheduleMode.exactAllowWhileIdle,
-        uiLocalNotificationDateInterpretation:
-            UILocalNotificationDateInterpretation.absoluteTime,
-      );
-      
-      print('Notification scheduled: $title for ${scheduledDate.toString()}');
+    try {
+      _exactAlarmGranted = await androidPlugin.canScheduleExactNotifications();
     } catch (e) {
-      print('Error scheduling notification: $e');
+      _exactAlarmGranted = null;
+    }
+    return _exactAlarmGranted != true;
+  }
+
+  Future<void> _ensureExactAlarmPermission() async {
+    if (_exactAlarmGranted == true) return;
+
+    final androidPlugin = _notificationsPlugin
+        .resolvePlatformSpecificImplementation<AndroidFlutterLocalNotificationsPlugin>();
+
+    if (androidPlugin != null) {
+      _exactAlarmGranted = await androidPlugin.requestExactAlarmsPermission();
+      print('Exact alarm permission granted: $_exactAlarmGranted');
+
+      if (_exactAlarmGranted != true) {
+        print('Exact alarm permission denied - notification may not work precisely');
+      }
     }
   }
 
@@ -39,6 +39,7 @@ class SummaryService {
   static const Duration _debounceDelay = Duration(milliseconds: 500);
   static const int _maxRetries = 3;
   static const Duration _initialRetryDelay = Duration(seconds: 1);
+  static const Duration _reachabilityCacheDuration = Duration(seconds: 30);
 
   final FirebaseFunctions _functions;
   final SummaryCache _cache;
@@ -52,6 +53,9 @@ class SummaryService {
   // Retry logic
   final Map<String, int> _retryAttempts = {};
 
+  // Last time the DNS reachability probe succeeded
+  DateTime? _lastReachableAt;
+
   SummaryService._({
     required FirebaseFunctions functions,
     required SummaryCache cache,
@@ -62,8 +66,50 @@ class SummaryService {
         _connectivity = connectivity,
         _auth = auth;
 
-  /// Creates and initializes a SummaryService instance
+  /// Creates a service around the given dependencies, bypassing the shared instance
+  @visibleForTesting
+  factory SummaryService.withDependencies({
+    required FirebaseFunctions functions,
+    required SummaryCache cache,
+    required Connectivity connectivity,
+    required FirebaseAuth auth,
+  }) {
+    return SummaryService._(
+      functions: functions,
+      cache: cache,
+      connectivity: connectivity,
+      auth: auth,
+    );
+  }
+
+  // Shared instance so every editor reuses the loaded cache and clients
+  static Future<SummaryService>? _sharedInstance;
+
+  /// Builds the shared instance; tests replace it to avoid Firebase
+  @visibleForTesting
+  static Future<SummaryService> Function() instanceFactory = _createInstance;
+
+  /// Drops the shared instance so the next create() initializes a new one
+  @visibleForTesting
+  static void resetSharedInstance() {
+    _sharedInstance = null;
+  }
+
+  /// Returns the shared SummaryService, creating and initializing it on first use
   static Future<SummaryService> create() async {
+    final pending = _sharedInstance ??= instanceFactory();
+    try {
+      return await pending;
+    } catch (_) {
+      // Allow a later call to retry initialization
+      if (identical(_sharedInstance, pending)) {
+        _sharedInstance = null;
+      }
+      rethrow;
+    }
+  }
+
+  static Future<SummaryService> _createInstance() async {
     final functions = FirebaseFunctions.instance;
     
     // Use emulator for development
@@ -220,15 +266,26 @@ class SummaryService {
       final connectivityResult = await _connectivity.checkConnectivity();
       
       if (connectivityResult == ConnectivityResult.none) {
+        _lastReachableAt = null;
         return false;
       }
 
+      // Skip the DNS probe if it succeeded recently
+      final lastReachableAt = _lastReachableAt;
+      if (lastReachableAt != null &&
+          DateTime.now().difference(lastReachableAt) < _reachabilityCacheDuration) {
+        return true;
+      }
+
       // Additional check by attempting to resolve a DNS lookup
       final result = await InternetAddress.lookup('google.com')
           .timeout(const Duration(seconds: 3));
       
-      return result.isNotEmpty && result[0].rawAddress.isNotEmpty;
+      final isReachable = result.isNotEmpty && result[0].rawAddress.isNotEmpty;
+      _lastReachableAt = isReachable ? DateTime.now() : null;
+      return isReachable;
     } catch (e) {
+      _lastReachableAt = null;
       return false;
     }
   }
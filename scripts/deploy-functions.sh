@@ -35,9 +35,10 @@ fi
 # Go back to project root
 cd ..
 
-# Deploy functions
-echo "🚀 Deploying functions to Firebase..."
-firebase deploy --only functions
+# Deploy functions together with the Firestore indexes and TTL policies
+# they and the app's queries rely on (firestore.indexes.json)
+echo "🚀 Deploying functions and Firestore indexes to Firebase..."
+firebase deploy --only functions,firestore:indexes
 
 if [ $? -eq 0 ]; then
     echo "✅ Functions deployed successfully!"
@@ -28,21 +28,16 @@ if [ ! -d "functions/node_modules" ]; then
     exit 1
 fi
 
-# Check if TypeScript files exist
-if [ ! -f "functions/src/index.ts" ]; then
-    echo "❌ Main index.ts file not found."
-    exit 1
-fi
-
-if [ ! -f "functions/src/summarization/summarizeNote.ts" ]; then
-    echo "❌ summarizeNote.ts file not found."
-    exit 1
-fi
+# Source modules the functions need before the build
+MODULES="index config/environment summarization/summarizeNote services/openRouterService services/openRouterStream"
 
-if [ ! -f "functions/src/services/openRouterService.ts" ]; then
-    echo "❌ openRouterService.ts file not found."
-    exit 1
-fi
+# Check if TypeScript files exist
+for module in $MODULES; do
+    if [ ! -f "functions/src/$module.ts" ]; then
+        echo "❌ $module.ts file not found."
+        exit 1
+    fi
+done
 
 # Check if environment configuration exists
 if [ ! -f "functions/.env" ]; then
@@ -57,27 +52,16 @@ npm run build
 if [ $? -eq 0 ]; then
     echo "✅ Build successful!"
     
-    # Check if compiled files exist
-    if [ -f "lib/index.js" ]; then
-        echo "✅ Main function compiled successfully"
-    else
-        echo "❌ Main function compilation failed"
-        exit 1
-    fi
-    
-    if [ -f "lib/summarization/summarizeNote.js" ]; then
-        echo "✅ SummarizeNote function compiled successfully"
-    else
-        echo "❌ SummarizeNote function compilation failed"
-        exit 1
-    fi
-    
-    if [ -f "lib/services/openRouterService.js" ]; then
-        echo "✅ OpenRouter service compiled successfully"
-    else
-        echo "❌ OpenRouter service compilation failed"
-        exit 1
-    fi
+    # Check that every non-test source module was compiled, so new
+    # modules are covered without updating a list
+    for module in $(cd src && find . -name '*.ts' ! -name '*.test.ts' | sed 's|^\./||; s|\.ts$||' | sort); do
+        if [ -f "lib/$module.js" ]; then
+            echo "✅ $module compiled successfully"
+        else
+            echo "❌ $module compilation failed"
+            exit 1
+        fi
+    done
     
     echo ""
     echo "🎉 Firebase Functions setup validation completed successfully!"
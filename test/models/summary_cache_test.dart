@@ -0,0 +1,66 @@
+import 'dart:convert';
+import 'package:crypto/crypto.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:shared_preferences/shared_preferences.dart';
+import 'package:smart_notes/models/summary_cache.dart';
+
+String expectedHash(String content) {
+  return sha256.convert(utf8.encode(content.trim())).toString();
+}
+
+void main() {
+  group('SummaryCacheEntry.createContentHash', () {
+    test('hashing A, then B, then A again gives the correct digests', () {
+      const contentA = 'First note content about the weekly planning meeting.';
+      const contentB = 'Second note content with a different shopping list.';
+
+      final firstA = SummaryCacheEntry.createContentHash(contentA);
+      final hashB = SummaryCacheEntry.createContentHash(contentB);
+      final secondA = SummaryCacheEntry.createContentHash(contentA);
+
+      expect(firstA, expectedHash(contentA));
+      expect(hashB, expectedHash(contentB));
+      expect(secondA, expectedHash(contentA));
+      expect(hashB, isNot(firstA));
+    });
+
+    test('repeated hashing of the same content is stable', () {
+      const content = '  Padded note content that should be trimmed.  ';
+
+      final first = SummaryCacheEntry.createContentHash(content);
+      final second = SummaryCacheEntry.createContentHash(content);
+
+      expect(first, expectedHash(content));
+      expect(second, first);
+    });
+
+    test('inputs that differ only in surrounding whitespace share a digest', () {
+      const content = 'Note content';
+
+      expect(
+        SummaryCacheEntry.createContentHash('  $content\n'),
+        SummaryCacheEntry.createContentHash(content),
+      );
+    });
+  });
+
+  group('SummaryCache', () {
+    setUp(() {
+      SharedPreferences.setMockInitialValues({});
+    });
+
+    test('cache stays valid for one note while another is hashed', () async {
+      final cache = await SummaryCache.create();
+      const contentA = 'Content of the first note.';
+      const contentB = 'Content of the second note.';
+
+      await cache.put('note-a', 'Summary A', contentA);
+      await cache.put('note-b', 'Summary B', contentB);
+
+      expect(cache.isValid('note-a', contentA), isTrue);
+      expect(cache.isValid('note-b', contentB), isTrue);
+      expect(cache.isValid('note-a', contentB), isFalse);
+      expect(cache.get('note-a', contentA)?.summary, 'Summary A');
+    });
+  });
+}
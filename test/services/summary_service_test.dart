@@ -1,8 +1,12 @@
 import 'package:flutter_test/flutter_test.dart';
 import 'package:smart_notes/services/summary_service.dart';
 import 'package:smart_notes/models/note.dart';
+import 'package:smart_notes/models/summary_cache.dart';
 import 'package:firebase_core/firebase_core.dart';
+import 'package:firebase_auth/firebase_auth.dart';
 import 'package:cloud_functions/cloud_functions.dart';
+import 'package:connectivity_plus/connectivity_plus.dart';
+import 'package:shared_preferences/shared_preferences.dart';
 import 'dart:math';
 import 'dart:async';
 import 'dart:io';
@@ -126,8 +130,73 @@ class MockSummaryServiceForErrorTesting {
   }
 }
 
+// Stand-ins for the Firebase clients; the shared-instance tests never call them
+class FakeFirebaseFunctions extends Fake implements FirebaseFunctions {}
+
+class FakeFirebaseAuth extends Fake implements FirebaseAuth {}
+
+class FakeConnectivity extends Fake implements Connectivity {}
+
+Future<SummaryService> createTestService() async {
+  SharedPreferences.setMockInitialValues({});
+  return SummaryService.withDependencies(
+    functions: FakeFirebaseFunctions(),
+    cache: await SummaryCache.create(),
+    connectivity: FakeConnectivity(),
+    auth: FakeFirebaseAuth(),
+  );
+}
+
 void main() {
   group('SummaryService', () {
+    group('Shared instance', () {
+      final originalFactory = SummaryService.instanceFactory;
+
+      setUp(SummaryService.resetSharedInstance);
+
+      tearDown(() {
+        SummaryService.instanceFactory = originalFactory;
+        SummaryService.resetSharedInstance();
+      });
+
+      test('create() returns the same instance across calls', () async {
+        var factoryCalls = 0;
+        SummaryService.instanceFactory = () {
+          factoryCalls++;
+          return createTestService();
+        };
+
+        // Start both calls before the first finishes initializing
+        final results = await Future.wait([
+          SummaryService.create(),
+          SummaryService.create(),
+        ]);
+        final later = await SummaryService.create();
+
+        expect(results[1], same(results[0]));
+        expect(later, same(results[0]));
+        expect(factoryCalls, 1);
+      });
+
+      test('create() retries initialization after a failure', () async {
+        var factoryCalls = 0;
+        SummaryService.instanceFactory = () async {
+          factoryCalls++;
+          if (factoryCalls == 1) {
+            throw StateError('Initialization failed');
+          }
+          return createTestService();
+        };
+
+        await expectLater(SummaryService.create(), throwsStateError);
+
+        final service = await SummaryService.create();
+        expect(service, isA<SummaryService>());
+        expect(await SummaryService.create(), same(service));
+        expect(factoryCalls, 2);
+      });
+    });
+
     test('Firebase Functions function name should be correct', () {
       // Test that we're using the correct function name
       // This validates our configuration matches the exported function name